@@ -1,6 +1,8 @@
 import argparse
+import ctypes
 import logging
 import signal
+import sys
 import threading
 
 from .config import Config
@@ -8,6 +10,7 @@ from .checker import Checker
 from .state import StateManager
 from .report import format_full_report, format_startup_report
 from .notifiers.base import BaseNotifier
+from .notifiers.queued import QueuedNotifier
 from .notifiers.slack import SlackNotifier
 from .notifiers.telegram import TelegramNotifier
 from .notifiers.logger import LogNotifier
@@ -16,6 +19,11 @@ log = logging.getLogger("horcrux_monitor")
 
 shutdown_event = threading.Event()
 
+PR_SET_TIMERSLACK = 29  # <linux/prctl.h>
+
+# Full tracebacks logged for a run of identical loop errors before summarising
+MAX_REPEATED_TRACEBACKS = 3
+
 
 def main():
     parser = argparse.ArgumentParser(description="Horcrux Monitoring Daemon")
@@ -42,12 +50,15 @@ def main():
 
     if not args.dry_run:
         if config.slack_webhook_url:
-            notifiers.append(SlackNotifier(config.slack_webhook_url, config.slack_mention))
+            notifiers.append(QueuedNotifier(SlackNotifier(config.slack_webhook_url, config.slack_mention)))
             log.info("Slack notifier enabled")
         if config.telegram_enabled and config.telegram_bot_token:
-            notifiers.append(TelegramNotifier(config.telegram_bot_token, config.telegram_chat_id))
+            notifiers.append(QueuedNotifier(TelegramNotifier(config.telegram_bot_token, config.telegram_chat_id)))
             log.info("Telegram notifier enabled")
 
+    if config.check_interval < 1:
+        _reduce_timer_slack()
+
     checker = Checker(config)
     state = StateManager(
         alert_cooldown=config.alert_cooldown,
@@ -74,44 +85,85 @@ def main():
     state.process_report(report)  # Initialize state from first run
 
     if args.once:
+        checker.close()
+        close_all(notifiers)
         return
 
-    # Daemon loop
-    while not shutdown_event.is_set():
-        if shutdown_event.wait(config.check_interval):
-            break
+    last_error = None
+    error_streak = 0
 
+    # Daemon loop — wait() returns True as soon as a signal sets the event
+    while not shutdown_event.wait(checker.next_interval()):
         try:
             report = checker.run()
             result = state.process_report(report)
 
-            # Problem alerts — send full report instead of just problems
+            # Every notification is the full report, so send at most one per
+            # tick, titled by the most urgent reason (alert > recovery > scheduled)
+            titles = []
             if result["new_alerts"] or result["re_alerts"]:
-                msg = format_full_report(report, config.timezone, name=name, title="Horcrux Alert")
-                notify_all(notifiers, msg)
-
-            # Recovery notifications — send full report
+                titles.append("Horcrux Alert")
             if result["recoveries"]:
-                msg = format_full_report(report, config.timezone, name=name, title="Horcrux Recovery")
-                notify_all(notifiers, msg)
-
-            # Scheduled reports
+                titles.append("Horcrux Recovery")
+            # Always evaluated so the scheduled slot is consumed
             if state.is_scheduled_report_due():
-                msg = format_full_report(report, config.timezone, name=name)
-                notify_all(notifiers, msg)
+                titles.append("Horcrux Status Report")
 
-        except Exception:
-            log.exception("Error in monitoring loop")
+            if titles:
+                msg = format_full_report(report, config.timezone, name=name, title=titles[0])
+                notify_all(notifiers, msg)
 
+        except Exception as e:
+            error = (type(e), str(e))
+            error_streak = error_streak + 1 if error == last_error else 1
+            last_error = error
+            if error_streak <= MAX_REPEATED_TRACEBACKS:
+                log.exception("Error in monitoring loop")
+            elif error_streak == MAX_REPEATED_TRACEBACKS + 1:
+                log.warning("Error in monitoring loop keeps repeating, suppressing tracebacks: %s: %s",
+                            type(e).__name__, e)
+        else:
+            if error_streak > MAX_REPEATED_TRACEBACKS:
+                log.info("Monitoring loop recovered after %d consecutive errors", error_streak)
+            last_error = None
+            error_streak = 0
+
+    checker.close()
+    close_all(notifiers)
     log.info("Horcrux monitor stopped")
 
 
+def _reduce_timer_slack():
+    """Ask the kernel for 1ns timer slack so short interval waits wake on time (Linux only)."""
+    if not sys.platform.startswith("linux"):
+        return
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.prctl(PR_SET_TIMERSLACK, 1, 0, 0, 0) != 0:
+            log.debug("prctl(PR_SET_TIMERSLACK) failed: errno %d", ctypes.get_errno())
+    except (OSError, AttributeError) as e:
+        log.debug("Could not set timer slack: %s", e)
+
+
 def notify_all(notifiers: list[BaseNotifier], message: str):
+    # Remote notifiers are queued, so this returns without waiting on webhooks
+    for n in notifiers:
+        _safe_send(n, message)
+
+
+def close_all(notifiers: list[BaseNotifier]):
     for n in notifiers:
         try:
-            n.send(message)
+            n.close()
         except Exception:
-            log.exception("Notifier %s failed", type(n).__name__)
+            log.exception("Notifier %s failed to close", type(n).__name__)
+
+
+def _safe_send(notifier: BaseNotifier, message: str):
+    try:
+        notifier.send(message)
+    except Exception:
+        log.exception("Notifier %s failed", type(notifier).__name__)
 
 
 if __name__ == "__main__":
@@ -1,68 +1,160 @@
 import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from .models import CheckResult, CheckStatus, CosignerStatus, SentryStatus, FullReport
 from .config import Config
 from .collector import (
-    fetch_metrics, get_metric, get_labeled_metrics,
-    fetch_block_height, parse_address,
+    Metrics, MetricsClient, get_metric, get_labeled_metrics,
+    fetch_block_height,
 )
 
 log = logging.getLogger(__name__)
 
+_PEERID_RE = re.compile(r'peerid="([^"]+)"')
+
+# Counters alerted on when they grow between checks:
+# (metric name, report field, check / alert key, status when growing, label)
+_COUNTER_CHECKS = (
+    ("signer_error_total_insufficient_cosigners", "insufficient_cosigner_errors",
+     "insufficient_cosigners", CheckStatus.CRITICAL, "Insufficient cosigner errors"),
+    ("signer_total_raft_leader_election_timeout", "raft_election_timeouts",
+     "raft_election_timeouts", CheckStatus.WARNING, "Election timeouts"),
+    # Gauge that grows while horcrux can't reach a sentry
+    ("signer_sentry_connect_tries", "sentry_connect_tries",
+     "sentry_connect_tries", CheckStatus.WARNING, "Sentry connect retries"),
+    ("signer_error_total_invalid_signatures", "invalid_signature_errors",
+     "invalid_signatures", CheckStatus.CRITICAL, "Invalid signature errors"),
+    ("signer_total_beyond_block_errors", "beyond_block_errors",
+     "beyond_block_errors", CheckStatus.WARNING, "Beyond-block errors"),
+    ("signer_total_failed_sign_vote", "failed_sign_votes",
+     "failed_sign_votes", CheckStatus.WARNING, "Failed sign votes"),
+)
+
+# Every metric read by the checks below; the scrape keeps only these
+METRIC_NAMES = frozenset({
+    "signer_last_prevote_height",
+    "signer_last_precommit_height",
+    "signer_missed_prevotes",
+    "signer_missed_precommits",
+    "signer_seconds_since_last_precommit",
+    "signer_error_total_insufficient_cosigners",
+    "signer_total_raft_leader_election_timeout",
+    "signer_seconds_since_last_local_ephemeral_share_time",
+    "signer_missed_ephemeral_shares",
+    "signer_sentry_connect_tries",
+    "signer_error_total_invalid_signatures",
+    "signer_total_beyond_block_errors",
+    "signer_total_failed_sign_vote",
+    "process_open_fds",
+    "process_max_fds",
+    "process_resident_memory_bytes",
+    "go_goroutines",
+})
+
+# (metric name, report field / threshold / alert key, status above threshold, message template)
+_THRESHOLD_CHECKS = (
+    ("signer_missed_prevotes", "missed_prevotes", CheckStatus.WARNING, "Missed prevotes (consecutive): {}"),
+    ("signer_missed_precommits", "missed_precommits", CheckStatus.CRITICAL, "Missed precommits (consecutive): {}"),
+)
+
+
+@lru_cache(maxsize=256)
+def _ok_check(key: str, template: str, args: tuple) -> CheckResult:
+    """Shared OK result; values that hold steady between polls reuse the same object."""
+    return CheckResult(name=key, status=CheckStatus.OK, template=template, args=args, alert_key=key)
+
 
 class Checker:
     def __init__(self, config: Config):
         self.config = config
-        self.prev_insufficient_cosigners: Optional[float] = None
-        self.prev_raft_election_timeouts: Optional[float] = None
+        self.prev_counters: Dict[str, float] = {}    # counter metric → previous value
         self.prev_missed_shares: Dict[str, int] = {}   # addr → previous value
         self.cosigner_miss_streak: Dict[str, int] = {}  # addr → consecutive growing checks
+        self._peer_addr_by_label: Dict[str, str] = {}   # label string → parsed peer addr
         self.prev_height: Optional[int] = None
         self.height_stale_count: int = 0
-        self.prev_sentry_connect_tries: Optional[float] = None
-        self.prev_invalid_signatures: Optional[float] = None
-        self.prev_beyond_block_errors: Optional[float] = None
-        self.prev_failed_sign_votes: Optional[float] = None
         self.prev_goroutines: Optional[int] = None
         self.goroutine_grow_streak: int = 0
+        self._interval_factor: int = 1  # check_interval multiplier, doubled per all-OK run
+        # Keeps the scrape's validators between runs for conditional GETs
+        self._metrics_client = (
+            MetricsClient(config.metrics_url, config.metrics_timeout, METRIC_NAMES)
+            if config.metrics_url else None
+        )
+        self._cosigners = [(cs["shard_id"], cs["address"], cs["host"]) for cs in config.cosigners]
+        self._cosigner_addrs = frozenset(addr for _, addr, _ in self._cosigners if addr)
+        self._sentry_hosts = [(s["address"], s["host"]) for s in config.sentries]
+        # Sentry RPC probes are independent network round-trips — run them concurrently
+        self._sentry_pool = ThreadPoolExecutor(
+            max_workers=min(32, len(config.sentries) or 1),
+            thread_name_prefix="sentry-rpc",
+        )
+
+    def close(self):
+        """Release the sentry probe worker threads."""
+        self._sentry_pool.shutdown(wait=False, cancel_futures=True)
 
     def run(self) -> FullReport:
         """Run all health checks and return a FullReport."""
         cfg = self.config
         report = FullReport()
-        checks: List[CheckResult] = []
+        checks: List[CheckResult] = report.checks
+
+        # Sentry probes run in the background while metrics are fetched and checked
+        probes = self._start_sentry_probes()
 
         # Fetch metrics
         metrics = None
-        if cfg.metrics_url:
-            metrics = fetch_metrics(cfg.metrics_url, cfg.metrics_timeout)
+        if self._metrics_client is not None:
+            metrics = self._metrics_client.fetch()
 
         if metrics is None:
             report.metrics_ok = False
             checks.append(CheckResult(
                 name="metrics_endpoint",
                 status=CheckStatus.CRITICAL,
-                message="Metrics endpoint unreachable",
+                template="Metrics endpoint unreachable",
                 alert_key="metrics_endpoint",
             ))
         else:
             report.metrics_ok = True
             self._check_raft(metrics, report, checks)
             self._check_signing(metrics, report, checks)
-            self._check_sentry_connect(metrics, report, checks)
-            self._check_error_counters(metrics, report, checks)
+            stable: List[str] = []
+            for counter in _COUNTER_CHECKS:
+                self._counter_delta(metrics, report, checks, stable, *counter)
+            if stable and cfg.emit_stable_ok:
+                checks.append(_ok_check("counters_stable", "Stable: {}", (", ".join(stable),)))
             self._check_signing_freshness(metrics, report, checks)
             self._check_process_health(metrics, report, checks)
 
         self._check_cosigners(metrics, report, checks)
-        self._check_sentries(report, checks)
+        self._check_sentries(probes, report, checks)
         self._check_sentry_divergence(report, checks)
 
-        report.checks = checks
+        # An open streak still reports OK but may turn CRITICAL next run: stay at base rate
+        if (report.has_problems or self.height_stale_count or self.goroutine_grow_streak
+                or any(self.cosigner_miss_streak.values())):
+            self._interval_factor = 1
+        else:
+            self._interval_factor = min(self._interval_factor * 2, cfg.max_interval_factor)
+
         return report
 
-    def _check_signing(self, metrics: Dict, report: FullReport, checks: List[CheckResult]):
+    def next_interval(self) -> float:
+        """Seconds to wait before the next run.
+
+        check_interval while anything is wrong or a stale/growth streak is open;
+        widened up to max_interval_factor times while consecutive runs come back
+        all OK with no streak running.
+        """
+        return self.config.check_interval * self._interval_factor
+
+    def _check_signing(self, metrics: Metrics, report: FullReport, checks: List[CheckResult]):
         cfg = self.config
         th = cfg.thresholds
 
@@ -90,58 +182,40 @@ class Checker:
             eph = report.seconds_since_last_ephemeral_share
             is_active_follower = eph is not None and eph < cfg.block_time * 3
 
-            if self.height_stale_count >= th["height_stale_checks"] and not is_active_follower:
+            if self.height_stale_count >= th.height_stale_checks and not is_active_follower:
                 checks.append(CheckResult(
                     name="height_stale",
                     status=CheckStatus.CRITICAL,
-                    message=f"Height stale at {current_height:,} for {self.height_stale_count} checks",
+                    template="Height stale at {:,} for {} checks",
+                    args=(current_height, self.height_stale_count),
                     alert_key="height_stale",
                 ))
             else:
                 checks.append(CheckResult(
                     name="height_stale",
                     status=CheckStatus.OK,
-                    message=f"Last prevote height: {current_height:,}",
+                    template="Last prevote height: {:,}",
+                    args=(current_height,),
                     alert_key="height_stale",
                 ))
 
-        # Missed prevotes
-        val = get_metric(metrics, "signer_missed_prevotes")
-        if val is not None:
-            report.missed_prevotes = int(val)
-            if int(val) > th["missed_prevotes"]:
+        # Consecutive-miss gauges compared against their thresholds
+        for metric_name, key, bad_status, template in _THRESHOLD_CHECKS:
+            val = get_metric(metrics, metric_name)
+            if val is None:
+                continue
+            v = int(val)
+            setattr(report, key, v)
+            if v > getattr(th, key):
                 checks.append(CheckResult(
-                    name="missed_prevotes",
-                    status=CheckStatus.WARNING,
-                    message=f"Missed prevotes (consecutive): {int(val)}",
-                    alert_key="missed_prevotes",
+                    name=key,
+                    status=bad_status,
+                    template=template,
+                    args=(v,),
+                    alert_key=key,
                 ))
             else:
-                checks.append(CheckResult(
-                    name="missed_prevotes",
-                    status=CheckStatus.OK,
-                    message=f"Missed prevotes (consecutive): {int(val)}",
-                    alert_key="missed_prevotes",
-                ))
-
-        # Missed precommits
-        val = get_metric(metrics, "signer_missed_precommits")
-        if val is not None:
-            report.missed_precommits = int(val)
-            if int(val) > th["missed_precommits"]:
-                checks.append(CheckResult(
-                    name="missed_precommits",
-                    status=CheckStatus.CRITICAL,
-                    message=f"Missed precommits (consecutive): {int(val)}",
-                    alert_key="missed_precommits",
-                ))
-            else:
-                checks.append(CheckResult(
-                    name="missed_precommits",
-                    status=CheckStatus.OK,
-                    message=f"Missed precommits (consecutive): {int(val)}",
-                    alert_key="missed_precommits",
-                ))
+                checks.append(_ok_check(key, template, (v,)))
 
         # Seconds since last precommit (informational only, no alert —
         # non-leader cosigners legitimately show large values)
@@ -151,93 +225,43 @@ class Checker:
             # Fresh precommit means this cosigner is the Raft leader
             report.is_raft_leader = val < cfg.block_time * 3
 
-        # Insufficient cosigner errors (counter — detect increase)
-        val = get_metric(metrics, "signer_error_total_insufficient_cosigners")
-        if val is not None:
-            report.insufficient_cosigner_errors = int(val)
-            if self.prev_insufficient_cosigners is not None:
-                delta = val - self.prev_insufficient_cosigners
-                if delta > 0:
-                    checks.append(CheckResult(
-                        name="insufficient_cosigners",
-                        status=CheckStatus.CRITICAL,
-                        message=f"Insufficient cosigner errors: {int(val):,} (+{int(delta)} since last check)",
-                        alert_key="insufficient_cosigners",
-                    ))
-                else:
-                    checks.append(CheckResult(
-                        name="insufficient_cosigners",
-                        status=CheckStatus.OK,
-                        message=f"Insufficient cosigner errors: {int(val):,} (stable)",
-                        alert_key="insufficient_cosigners",
-                    ))
-            else:
-                checks.append(CheckResult(
-                    name="insufficient_cosigners",
-                    status=CheckStatus.OK,
-                    message=f"Insufficient cosigner errors: {int(val):,} (stable)",
-                    alert_key="insufficient_cosigners",
-                ))
-            self.prev_insufficient_cosigners = val
-
-    def _check_raft(self, metrics: Dict, report: FullReport, checks: List[CheckResult]):
-        # Raft election timeouts (counter — detect increase)
-        val = get_metric(metrics, "signer_total_raft_leader_election_timeout")
-        if val is not None:
-            report.raft_election_timeouts = int(val)
-            if self.prev_raft_election_timeouts is not None:
-                delta = val - self.prev_raft_election_timeouts
-                if delta > 0:
-                    checks.append(CheckResult(
-                        name="raft_election_timeouts",
-                        status=CheckStatus.WARNING,
-                        message=f"Election timeouts: {int(val):,} (+{int(delta)} since last check)",
-                        alert_key="raft_election_timeouts",
-                    ))
-                else:
-                    checks.append(CheckResult(
-                        name="raft_election_timeouts",
-                        status=CheckStatus.OK,
-                        message=f"Election timeouts: {int(val):,} (stable)",
-                        alert_key="raft_election_timeouts",
-                    ))
-            else:
-                checks.append(CheckResult(
-                    name="raft_election_timeouts",
-                    status=CheckStatus.OK,
-                    message=f"Election timeouts: {int(val):,} (stable)",
-                    alert_key="raft_election_timeouts",
-                ))
-            self.prev_raft_election_timeouts = val
-
+    def _check_raft(self, metrics: Metrics, report: FullReport, checks: List[CheckResult]):
         # Seconds since last ephemeral share
         val = get_metric(metrics, "signer_seconds_since_last_local_ephemeral_share_time")
         if val is not None:
             report.seconds_since_last_ephemeral_share = val
 
 
-    def _check_cosigners(self, metrics: Optional[Dict], report: FullReport, checks: List[CheckResult]):
-        cfg = self.config
-        th = cfg.thresholds
-
+    def _check_cosigners(self, metrics: Optional[Metrics], report: FullReport, checks: List[CheckResult]):
         # Get missed ephemeral shares from metrics
         # peerid label is the full p2pAddr, e.g. peerid="tcp://192.168.101.102:9876"
         missed_shares_by_addr = {}
         if metrics:
             labeled = get_labeled_metrics(metrics, "signer_missed_ephemeral_shares")
+            peer_addrs = self._peer_addr_by_label
             for label, val in labeled.items():
                 # label is like: peerid="tcp://192.168.101.102:9876"
+                addr_key = peer_addrs.get(label)
+                if addr_key is None:
+                    m = _PEERID_RE.search(label)
+                    if m is None:
+                        continue
+                    addr_key = peer_addrs[label] = m.group(1)
                 try:
-                    addr_key = label.split('"')[1]
                     missed_shares_by_addr[addr_key] = int(val)
-                except (IndexError, ValueError):
+                except ValueError:
                     continue
 
-        for cs in cfg.cosigners:
-            shard_id = cs["shard_id"]
-            addr = cs["address"]
+        has_shares = bool(missed_shares_by_addr)
+        # Configured cosigners that horcrux reports shares for — everyone but self
+        reported = missed_shares_by_addr.keys() & self._cosigner_addrs
+        prev_missed = self.prev_missed_shares
+        streaks = self.cosigner_miss_streak
+        add_cosigner = report.cosigners.append
+
+        for shard_id, addr, host in self._cosigners:
             # Self = cosigner whose address is NOT in metrics (no missed shares for self)
-            is_self = bool(addr) and addr not in missed_shares_by_addr and bool(missed_shares_by_addr)
+            is_self = has_shares and bool(addr) and addr not in reported
             shares = None if is_self else missed_shares_by_addr.get(addr)
 
             status = CosignerStatus(
@@ -245,65 +269,49 @@ class Checker:
                 address=addr or "(self)",
                 missed_shares=shares,
                 is_self=is_self,
+                host=host,
             )
-            report.cosigners.append(status)
+            add_cosigner(status)
 
             # Missed shares — alert when growing for 2+ consecutive checks (ignores brief hiccups)
             if shares is not None and not is_self:
-                prev = self.prev_missed_shares.get(addr)
-                self.prev_missed_shares[addr] = shares
+                prev = prev_missed.get(addr)
+                prev_missed[addr] = shares
                 if prev is not None and shares > prev:
-                    self.cosigner_miss_streak[addr] = self.cosigner_miss_streak.get(addr, 0) + 1
+                    streak = streaks.get(addr, 0) + 1
                 else:
-                    self.cosigner_miss_streak[addr] = 0
+                    streak = 0
+                streaks[addr] = streak
 
-                if self.cosigner_miss_streak.get(addr, 0) >= 3:
+                if streak >= 3:
                     checks.append(CheckResult(
                         name=f"cosigner_{shard_id}_shares",
                         status=CheckStatus.WARNING,
-                        message=f"Cosigner shard {shard_id} ({addr}) missed shares growing ({shares})",
+                        template="Cosigner shard {} ({}) missed shares growing ({})",
+                        args=(shard_id, addr, shares),
                         alert_key=f"cosigner_{shard_id}_shares",
                     ))
 
-    def _check_sentry_connect(self, metrics: Dict, report: FullReport, checks: List[CheckResult]):
-        """Check signer_sentry_connect_tries gauge — grows while horcrux can't reach a sentry."""
-        val = get_metric(metrics, "signer_sentry_connect_tries")
-        if val is not None:
-            report.sentry_connect_tries = int(val)
-            if self.prev_sentry_connect_tries is not None:
-                delta = val - self.prev_sentry_connect_tries
-                if delta > 0:
-                    checks.append(CheckResult(
-                        name="sentry_connect_tries",
-                        status=CheckStatus.WARNING,
-                        message=f"Sentry connect retries: {int(val):,} (+{int(delta)} since last check)",
-                        alert_key="sentry_connect_tries",
-                    ))
-                else:
-                    checks.append(CheckResult(
-                        name="sentry_connect_tries",
-                        status=CheckStatus.OK,
-                        message=f"Sentry connect retries: {int(val):,} (stable)",
-                        alert_key="sentry_connect_tries",
-                    ))
-            else:
-                checks.append(CheckResult(
-                    name="sentry_connect_tries",
-                    status=CheckStatus.OK,
-                    message=f"Sentry connect retries: {int(val):,} (stable)",
-                    alert_key="sentry_connect_tries",
-                ))
-            self.prev_sentry_connect_tries = val
-
-    def _check_sentries(self, report: FullReport, checks: List[CheckResult]):
+    def _start_sentry_probes(self):
+        """Submit one RPC height probe per sentry; returns (deadline, [(addr, host, future)])."""
         cfg = self.config
-        th = cfg.thresholds
-        rpc_port = th["rpc_port"]
-
-        for i, sentry in enumerate(cfg.sentries):
-            addr = sentry["address"]
-            host, _ = parse_address(addr)
-            block_height = fetch_block_height(host, rpc_port, cfg.metrics_timeout)
+        rpc_port = cfg.thresholds.rpc_port
+        # One deadline for the whole batch so a hung sentry can't stall the check cycle
+        deadline = time.monotonic() + cfg.metrics_timeout + 1
+        targets = [
+            (addr, host, self._sentry_pool.submit(fetch_block_height, host, rpc_port, cfg.metrics_timeout))
+            for addr, host in self._sentry_hosts
+        ]
+        return deadline, targets
+
+    def _check_sentries(self, probes, report: FullReport, checks: List[CheckResult]):
+        rpc_port = self.config.thresholds.rpc_port
+        deadline, targets = probes
+
+        wait([f for _, _, f in targets], timeout=max(0.0, deadline - time.monotonic()))
+
+        for i, (addr, host, future) in enumerate(targets):
+            block_height = future.result() if future.done() else None
             rpc_ok = block_height is not None
 
             status = SentryStatus(
@@ -319,68 +327,40 @@ class Checker:
                 checks.append(CheckResult(
                     name=f"sentry_{i}_rpc",
                     status=CheckStatus.WARNING,
-                    message=f"Sentry {i + 1} ({addr}) RPC unreachable (port {rpc_port})",
+                    template="Sentry {} ({}) RPC unreachable (port {})",
+                    args=(i + 1, addr, rpc_port),
                     alert_key=f"sentry_{i}_rpc",
                 ))
 
-    def _check_error_counters(self, metrics: Dict, report: FullReport, checks: List[CheckResult]):
-        cfg = self.config
+    def _counter_delta(self, metrics: Metrics, report: FullReport, checks: List[CheckResult],
+                       stable: List[str], metric_name: str, report_field: str, key: str,
+                       severity: CheckStatus, label: str):
+        """Record a counter on the report and flag it when it grew since the last check.
 
-        # Helper for counter-delta checks
-        def _counter_delta(metric_name, prev_attr, report_field, check_name, alert_key, severity, label):
-            val = get_metric(metrics, metric_name)
-            if val is None:
-                return
-            setattr(report, report_field, int(val))
-            prev = getattr(self, prev_attr)
-            if prev is not None:
-                delta = val - prev
-                if delta > 0:
-                    checks.append(CheckResult(
-                        name=check_name,
-                        status=severity,
-                        message=f"{label}: {int(val):,} (+{int(delta)} since last check)",
-                        alert_key=alert_key,
-                    ))
-                else:
-                    checks.append(CheckResult(
-                        name=check_name,
-                        status=CheckStatus.OK,
-                        message=f"{label}: {int(val):,} (stable)",
-                        alert_key=alert_key,
-                    ))
-            else:
-                checks.append(CheckResult(
-                    name=check_name,
-                    status=CheckStatus.OK,
-                    message=f"{label}: {int(val):,} (stable)",
-                    alert_key=alert_key,
-                ))
-            setattr(self, prev_attr, val)
-
-        _counter_delta(
-            "signer_error_total_invalid_signatures",
-            "prev_invalid_signatures",
-            "invalid_signature_errors",
-            "invalid_signatures", "invalid_signatures",
-            CheckStatus.CRITICAL, "Invalid signature errors",
-        )
-        _counter_delta(
-            "signer_total_beyond_block_errors",
-            "prev_beyond_block_errors",
-            "beyond_block_errors",
-            "beyond_block_errors", "beyond_block_errors",
-            CheckStatus.WARNING, "Beyond-block errors",
-        )
-        _counter_delta(
-            "signer_total_failed_sign_vote",
-            "prev_failed_sign_votes",
-            "failed_sign_votes",
-            "failed_sign_votes", "failed_sign_votes",
-            CheckStatus.WARNING, "Failed sign votes",
-        )
+        Counters that did not grow are added to stable by label; run() folds
+        them into a single counters_stable result when emit_stable_ok is set.
+        """
+        val = get_metric(metrics, metric_name)
+        if val is None:
+            return
+        count = int(val)
+        setattr(report, report_field, count)
+        prev = self.prev_counters.get(metric_name)
+        self.prev_counters[metric_name] = val
+        delta = val - prev if prev is not None else 0
+        if delta > 0:
+            checks.append(CheckResult(
+                name=key,
+                status=severity,
+                template="{}: {:,} (+{} since last check)",
+                args=(label, count, int(delta)),
+                alert_key=key,
+                detail=f" (+{int(delta)} since last check)",
+            ))
+        else:
+            stable.append(label)
 
-    def _check_signing_freshness(self, metrics: Dict, report: FullReport, checks: List[CheckResult]):
+    def _check_signing_freshness(self, metrics: Metrics, report: FullReport, checks: List[CheckResult]):
         cfg = self.config
         th = cfg.thresholds
         block_time = cfg.block_time
@@ -388,45 +368,55 @@ class Checker:
         # Ephemeral share staleness
         eph = report.seconds_since_last_ephemeral_share
         if eph is not None:
-            threshold = block_time * th["ephemeral_share_stale_factor"]
+            threshold = block_time * th.ephemeral_share_stale_factor
             if eph > threshold:
                 checks.append(CheckResult(
                     name="ephemeral_share_stale",
                     status=CheckStatus.WARNING,
-                    message=f"Last ephemeral share {eph:.1f}s ago (threshold {threshold}s)",
+                    template="Last ephemeral share {:.1f}s ago (threshold {}s)",
+                    args=(eph, threshold),
                     alert_key="ephemeral_share_stale",
                 ))
             else:
                 checks.append(CheckResult(
                     name="ephemeral_share_stale",
                     status=CheckStatus.OK,
-                    message=f"Last ephemeral share {eph:.1f}s ago",
+                    template="Last ephemeral share {:.1f}s ago",
+                    args=(eph,),
                     alert_key="ephemeral_share_stale",
                 ))
 
     def _check_sentry_divergence(self, report: FullReport, checks: List[CheckResult]):
         th = self.config.thresholds
-        heights = [s.block_height for s in report.sentries if s.block_height is not None]
-        if len(heights) < 2:
+        # Single pass, no intermediate list; needs at least two reachable sentries
+        lo = hi = None
+        seen = 0
+        for s in report.sentries:
+            h = s.block_height
+            if h is None:
+                continue
+            seen += 1
+            if lo is None or h < lo:
+                lo = h
+            if hi is None or h > hi:
+                hi = h
+        if seen < 2:
             return
-        divergence = max(heights) - min(heights)
-        max_allowed = th["sentry_height_divergence"]
+        divergence = hi - lo
+        max_allowed = th.sentry_height_divergence
         if divergence > max_allowed:
             checks.append(CheckResult(
                 name="sentry_height_divergence",
                 status=CheckStatus.WARNING,
-                message=f"Sentry height divergence: {divergence} blocks (max {max_allowed})",
+                template="Sentry height divergence: {} blocks (max {})",
+                args=(divergence, max_allowed),
                 alert_key="sentry_height_divergence",
             ))
         else:
-            checks.append(CheckResult(
-                name="sentry_height_divergence",
-                status=CheckStatus.OK,
-                message=f"Sentry height divergence: {divergence} blocks",
-                alert_key="sentry_height_divergence",
-            ))
+            checks.append(_ok_check("sentry_height_divergence", "Sentry height divergence: {} blocks",
+                                    (divergence,)))
 
-    def _check_process_health(self, metrics: Dict, report: FullReport, checks: List[CheckResult]):
+    def _check_process_health(self, metrics: Metrics, report: FullReport, checks: List[CheckResult]):
         th = self.config.thresholds
 
         # File descriptor usage
@@ -438,39 +428,38 @@ class Checker:
             report.process_max_fds = int(max_fds)
         if open_fds is not None and max_fds is not None and max_fds > 0:
             pct = (open_fds / max_fds) * 100
-            threshold = th["fd_usage_percent"]
+            threshold = th.fd_usage_percent
             if pct > threshold:
                 checks.append(CheckResult(
                     name="fd_usage",
                     status=CheckStatus.WARNING,
-                    message=f"FD usage: {int(open_fds)}/{int(max_fds)} ({pct:.0f}%, threshold {threshold}%)",
+                    template="FD usage: {}/{} ({:.0f}%, threshold {}%)",
+                    args=(int(open_fds), int(max_fds), pct, threshold),
                     alert_key="fd_usage",
                 ))
             else:
-                checks.append(CheckResult(
-                    name="fd_usage",
-                    status=CheckStatus.OK,
-                    message=f"FD usage: {int(open_fds)}/{int(max_fds)} ({pct:.0f}%)",
-                    alert_key="fd_usage",
-                ))
+                checks.append(_ok_check("fd_usage", "FD usage: {}/{} ({:.0f}%)",
+                                        (int(open_fds), int(max_fds), pct)))
 
         # Memory usage
         mem = get_metric(metrics, "process_resident_memory_bytes")
         if mem is not None:
             report.process_memory_bytes = int(mem)
-            mem_threshold = th["memory_bytes"]
+            mem_threshold = th.memory_bytes
             if mem_threshold > 0 and mem > mem_threshold:
                 checks.append(CheckResult(
                     name="memory_usage",
                     status=CheckStatus.WARNING,
-                    message=f"Resident memory: {_fmt_bytes(mem)} (threshold {_fmt_bytes(mem_threshold)})",
+                    template="Resident memory: {} (threshold {})",
+                    args=(_fmt_bytes(mem), _fmt_bytes(mem_threshold)),
                     alert_key="memory_usage",
                 ))
             else:
                 checks.append(CheckResult(
                     name="memory_usage",
                     status=CheckStatus.OK,
-                    message=f"Resident memory: {_fmt_bytes(mem)}",
+                    template="Resident memory: {}",
+                    args=(_fmt_bytes(mem),),
                     alert_key="memory_usage",
                 ))
 
@@ -484,21 +473,17 @@ class Checker:
                 self.goroutine_grow_streak = 0
             self.prev_goroutines = int(goroutines)
 
-            growth_threshold = th["goroutine_growth_checks"]
+            growth_threshold = th.goroutine_growth_checks
             if self.goroutine_grow_streak >= growth_threshold:
                 checks.append(CheckResult(
                     name="goroutine_growth",
                     status=CheckStatus.WARNING,
-                    message=f"Goroutines growing: {int(goroutines)} (growing for {self.goroutine_grow_streak} checks)",
+                    template="Goroutines growing: {} (growing for {} checks)",
+                    args=(int(goroutines), self.goroutine_grow_streak),
                     alert_key="goroutine_growth",
                 ))
             else:
-                checks.append(CheckResult(
-                    name="goroutine_growth",
-                    status=CheckStatus.OK,
-                    message=f"Goroutines: {int(goroutines)}",
-                    alert_key="goroutine_growth",
-                ))
+                checks.append(_ok_check("goroutine_growth", "Goroutines: {}", (int(goroutines),)))
 
 
 def _fmt_bytes(b: float) -> str:
@@ -1,84 +1,239 @@
+import ipaddress
 import logging
+import re
+import socket
+import time
+from dataclasses import dataclass, field
+
 import requests
-from typing import Dict, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from typing import AbstractSet, Dict, Optional, Tuple
 
 log = logging.getLogger(__name__)
 
+# Shared session so TCP connections to the same endpoints are kept alive between cycles
+_session = requests.Session()
+# Prometheus exposition handlers compress on request
+_session.headers["Accept-Encoding"] = "gzip"
+# One pool per endpoint (metrics + each sentry RPC), sized for concurrent sentry probes.
+# No retries: a failed probe is reported as-is and retried on the next cycle.
+_session.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
 
-def fetch_metrics(url: str, timeout: int = 5) -> Optional[Dict[str, float]]:
-    """Fetch and parse Prometheus text format metrics."""
-    try:
-        resp = requests.get(url, timeout=timeout)
-        resp.raise_for_status()
-        return parse_prometheus_text(resp.text)
-    except Exception as e:
-        log.debug("Failed to fetch metrics from %s: %s", url, e)
-        return None
+# Sentry hostnames are resolved at most once per TTL instead of on every probe
+DNS_TTL = 300
+_dns_cache: Dict[str, Tuple[str, float]] = {}
+
+# Pulls the one field we need out of a /status body without parsing the whole JSON document
+_LATEST_HEIGHT_RE = re.compile(rb'"latest_block_height"\s*:\s*"(\d+)"')
+
+
+@dataclass(slots=True)
+class Metrics:
+    """One parsed scrape, indexed at parse time.
+
+    scalar maps unlabeled series by name; labeled maps labeled series by
+    bare metric name, then by label string.
+    """
+    scalar: Dict[str, float] = field(default_factory=dict)
+    labeled: Dict[str, Dict[str, float]] = field(default_factory=dict)
 
 
-def parse_prometheus_text(text: str) -> Dict[str, float]:
-    """Parse Prometheus text exposition format into a flat dict.
+class MetricsClient:
+    """Scrapes one /metrics endpoint, revalidating with ETag / Last-Modified.
 
-    Keys include label suffixes for labeled metrics:
-      signer_missed_ephemeral_shares{peerid="2"} → "signer_missed_ephemeral_shares{peerid=\"2\"}"
+    When the exporter sends either validator, the next scrape is conditional
+    and a 304 reuses the previously parsed Metrics without a body or parse.
     """
-    metrics = {}
-    for line in text.splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
+
+    def __init__(self, url: str, timeout: int = 5, names: Optional[AbstractSet[str]] = None):
+        self.url = url
+        self.timeout = timeout
+        self.names = names
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._cached: Optional[Metrics] = None
+
+    def fetch(self) -> Optional[Metrics]:
+        headers = {}
+        if self._cached is not None:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+        try:
+            resp = _session.get(self.url, timeout=self.timeout, headers=headers)
+            if resp.status_code == 304:
+                if self._cached is None:
+                    # Nothing to reuse; an empty body would read as every metric missing
+                    log.debug("Got 304 from %s with no cached scrape", self.url)
+                    return None
+                return self._cached
+            resp.raise_for_status()
+            # Parse the raw body; only the kept names and labels are ever decoded
+            metrics = parse_prometheus_bytes(resp.content, self.names)
+        except Exception as e:
+            log.debug("Failed to fetch metrics from %s: %s", self.url, e)
+            return None
+        self._etag = resp.headers.get("ETag")
+        self._last_modified = resp.headers.get("Last-Modified")
+        self._cached = metrics if self._etag or self._last_modified else None
+        return metrics
+
+
+def fetch_metrics(url: str, timeout: int = 5,
+                  names: Optional[AbstractSet[str]] = None) -> Optional[Metrics]:
+    """Fetch and parse Prometheus text format metrics (one-off, unconditional).
+
+    If names is given, only series of those metrics are kept.
+    """
+    return MetricsClient(url, timeout, names).fetch()
+
+
+def parse_prometheus_text(text: str, names: Optional[AbstractSet[str]] = None) -> Metrics:
+    """Parse Prometheus text exposition format into scalar and labeled indexes.
+
+    See parse_prometheus_bytes, which does the work on the UTF-8 encoding.
+    """
+    return parse_prometheus_bytes(text.encode("utf-8"), names)
+
+
+def parse_prometheus_bytes(buf: bytes, names: Optional[AbstractSet[str]] = None) -> Metrics:
+    """Parse a raw Prometheus exposition body into scalar and labeled indexes.
+
+    Walks the bytes with find instead of decoding and splitting the body,
+    so comments and unwanted series are rejected without building a str.
+
+    Labeled series are binned by bare metric name in the same pass, e.g.:
+      signer_missed_ephemeral_shares{peerid="2"} 5 →
+        .labeled["signer_missed_ephemeral_shares"]["peerid=\"2\""] = 5.0
+
+    If names is given, series whose metric name is not in it are skipped
+    without converting their value.
+    """
+    wanted = None if names is None else {n.encode("utf-8") for n in names}
+    scalar = {}
+    labeled = {}
+    pos = 0
+    end = len(buf)
+    while pos < end:
+        start = pos
+        nl = buf.find(b"\n", start)
+        if nl < 0:
+            nl = end
+        pos = nl + 1
+        # Trailing blanks and CR are allowed; step back past them without slicing
+        while nl > start and buf[nl - 1] in b" \t\r":
+            nl -= 1
+        # Blank line or # HELP / # TYPE comment ("#" is 0x23)
+        if nl == start or buf[start] == 0x23:
+            continue
+        # Prometheus format: metric_name [labels] value
+        sp = buf.rfind(b" ", start, nl)
+        if sp <= start:
+            continue
+        # Runs of blanks between name and value belong to neither
+        key_end = sp
+        while key_end > start and buf[key_end - 1] in b" \t":
+            key_end -= 1
+        brace = buf.find(b"{", start, key_end)
+        name = buf[start:key_end] if brace < 0 else buf[start:brace]
+        # Reject unwanted series on the metric name, before slicing labels or float()
+        if wanted is not None and name not in wanted:
             continue
         try:
-            # Split into name (with optional labels) and value
-            if " " in line:
-                key, val_str = line.rsplit(" ", 1)
-                # Prometheus format: metric_name [labels] value [timestamp]
-                metrics[key.strip()] = float(val_str)
-        except (ValueError, IndexError):
+            # float() parses ASCII bytes directly
+            val = float(buf[sp + 1:nl])
+            if brace < 0:
+                scalar[name.decode("utf-8")] = val
+            elif buf[key_end - 1] == 0x7D:  # "}"
+                labels = buf[brace + 1:key_end - 1].decode("utf-8")
+                labeled.setdefault(name.decode("utf-8"), {})[labels] = val
+        except ValueError:  # includes UnicodeDecodeError
             continue
-    return metrics
+    return Metrics(scalar, labeled)
 
 
-def get_metric(metrics: Dict[str, float], name: str) -> Optional[float]:
-    """Get a metric value by exact name."""
-    return metrics.get(name)
+def get_metric(metrics: Metrics, name: str) -> Optional[float]:
+    """Get an unlabeled metric value by exact name."""
+    return metrics.scalar.get(name)
 
 
-def get_labeled_metrics(metrics: Dict[str, float], prefix: str) -> Dict[str, float]:
-    """Get all metrics matching a prefix (for labeled metrics).
+def get_labeled_metrics(metrics: Metrics, prefix: str) -> Dict[str, float]:
+    """Get all series of a labeled metric.
 
     Returns dict of label_content → value, e.g.:
       prefix="signer_missed_ephemeral_shares" →
         {"peerid=\"2\"": 0.0, "peerid=\"3\"": 5.0}
     """
-    result = {}
-    search = prefix + "{"
-    for key, val in metrics.items():
-        if key.startswith(search) and key.endswith("}"):
-            label_part = key[len(prefix) + 1:-1]  # content between { and }
-            result[label_part] = val
-    return result
+    return metrics.labeled.get(prefix, {})
 
 
 def fetch_block_height(host: str, rpc_port: int, timeout: int = 5) -> Optional[int]:
     """Fetch latest block height from CometBFT/Tendermint RPC /status endpoint."""
     url = f"http://{host}:{rpc_port}/status"
     try:
-        resp = requests.get(url, timeout=timeout)
+        ip = _resolve(host)
+        headers = None
+        if ip != host:
+            # Connect to the cached address but keep the name for vhosted RPC proxies
+            url = f"http://{ip}:{rpc_port}/status"
+            headers = {"Host": f"{host}:{rpc_port}"}
+        resp = _session.get(url, timeout=timeout, headers=headers)
         resp.raise_for_status()
+        m = _LATEST_HEIGHT_RE.search(resp.content)
+        if m:
+            return int(m.group(1))
+        # Unexpected layout (e.g. numeric height): take the slow path
         data = resp.json()
-        height = int(data["result"]["sync_info"]["latest_block_height"])
-        return height
+        return int(data["result"]["sync_info"]["latest_block_height"])
     except Exception as e:
         log.debug("Failed to fetch block height from %s: %s", url, e)
         return None
 
 
+def _resolve(host: str) -> str:
+    """Resolve a hostname to an IPv4 address, cached for DNS_TTL seconds.
+
+    IP literals are returned as-is. On resolution failure the hostname is
+    returned uncached, so the request fails (or succeeds) the normal way.
+    """
+    cached = _dns_cache.get(host)
+    now = time.monotonic()
+    if cached is not None and now - cached[1] < DNS_TTL:
+        return cached[0]
+    try:
+        ipaddress.ip_address(host)
+        return host
+    except ValueError:
+        pass
+    try:
+        ip = socket.gethostbyname(host)
+    except OSError as e:
+        log.debug("Failed to resolve %s: %s", host, e)
+        return host
+    _dns_cache[host] = (ip, now)
+    return ip
+
+
 def parse_address(addr: str) -> Tuple[str, int]:
     """Parse host:port string, stripping protocol prefix (tcp://, etc). Returns (host, port)."""
     # Strip protocol prefix
-    if "://" in addr:
-        addr = addr.split("://", 1)[1]
-    if ":" in addr:
-        parts = addr.rsplit(":", 1)
-        return parts[0], int(parts[1])
-    return addr, 0
+    scheme = addr.find("://")
+    if scheme >= 0:
+        addr = addr[scheme + 3:]
+    i = addr.rfind(":")
+    if i < 0:
+        return addr, 0
+    return addr[:i], int(addr[i + 1:])
+
+
+def host_from_address(addr: str) -> str:
+    """Extract host from address like 'tcp://192.168.100.2:2222' -> '192.168.100.2'.
+
+    Unlike parse_address, never fails on a missing or non-numeric port.
+    """
+    _, scheme, rest = addr.partition("://")
+    if scheme:
+        addr = rest
+    host, sep, _ = addr.rpartition(":")
+    return host if sep else addr
@@ -1,14 +1,29 @@
+import copy
 import os
 import yaml
 import logging
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from functools import cached_property
+
+from .collector import host_from_address, parse_address
 
 log = logging.getLogger(__name__)
 
+# libyaml-backed loader when available, pure-Python otherwise
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# abs path → (mtime_ns, size, parsed data), LRU-bounded
+_YAML_CACHE: "OrderedDict[str, tuple[int, int, dict]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+
 DEFAULTS = {
     "check_interval": 30,
+    "max_interval_factor": 1,
     "metrics_timeout": 2,
     "block_time": 6,
     "alert_cooldown": 300,
+    "emit_stable_ok": False,
     "timezone": "Asia/Dubai",
 "scheduled_reports": {"hours": [9, 13, 17]},
     "thresholds": {
@@ -26,10 +41,54 @@ DEFAULTS = {
 }
 
 
+@dataclass(slots=True, frozen=True)
+class Thresholds:
+    missed_precommits: int
+    missed_prevotes: int
+    missed_ephemeral_shares: int
+    height_stale_checks: int
+    rpc_port: int
+    ephemeral_share_stale_factor: int
+    sentry_height_divergence: int
+    fd_usage_percent: int
+    memory_bytes: int
+    goroutine_growth_checks: int
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Thresholds":
+        known = {f.name for f in fields(cls)}
+        unknown = sorted(set(data) - known)
+        if unknown:
+            log.warning("Ignoring unknown thresholds: %s", ", ".join(unknown))
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+def _load_yaml(path: str) -> dict:
+    """Load a YAML file, reusing the parsed result while mtime and size are unchanged.
+
+    Returns a deep copy so callers may mutate the result freely.
+    """
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    cached = _YAML_CACHE.get(key)
+    # Nanosecond mtime: a rewrite within the same second still invalidates
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    with open(key) as f:
+        data = yaml.load(f, Loader=_Loader) or {}
+
+    _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    _YAML_CACHE.move_to_end(key)
+    while len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
+
+
 class Config:
     def __init__(self, path: str):
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+        data = _load_yaml(path)
 
         # Merge defaults
         for k, v in DEFAULTS.items():
@@ -42,12 +101,19 @@ class Config:
 
         self.name: str = data.get("name", "horcrux")
         self.check_interval: int = data["check_interval"]
+        self.max_interval_factor: int = data["max_interval_factor"]
+        if not isinstance(self.max_interval_factor, int) or self.max_interval_factor < 1:
+            # 0 or below would make the loop wait 0s and hammer every endpoint
+            log.warning("max_interval_factor must be an integer >= 1, got %r; using 1",
+                        self.max_interval_factor)
+            self.max_interval_factor = 1
         self.metrics_timeout: int = data["metrics_timeout"]
         self.block_time: int = data["block_time"]
         self.alert_cooldown: int = data["alert_cooldown"]
+        self.emit_stable_ok: bool = data["emit_stable_ok"]
         self.timezone: str = data["timezone"]
         self.scheduled_hours: list = data["scheduled_reports"]["hours"]
-        self.thresholds: dict = data["thresholds"]
+        self.thresholds = Thresholds.from_dict(data["thresholds"])
 
         # Slack config with env overrides
         slack = data.get("slack", {})
@@ -69,8 +135,8 @@ class Config:
         # Load horcrux config
         horcrux_path = data.get("horcrux_config", "")
         self.debug_addr = ""
-        self.cosigners = []  # list of {shard_id, address, is_self}
-        self.sentries = []   # list of {address}
+        self.cosigners = []  # list of {shard_id, address, host}
+        self.sentries = []   # list of {address, host}
         self.threshold = 0
         self.shards_total = 0
 
@@ -79,8 +145,7 @@ class Config:
 
     def _load_horcrux_config(self, path: str):
         try:
-            with open(path) as f:
-                hc = yaml.safe_load(f) or {}
+            hc = _load_yaml(path)
         except Exception as e:
             log.error("Failed to load horcrux config %s: %s", path, e)
             return
@@ -95,9 +160,11 @@ class Config:
         self.shards_total = len(cosigners_cfg) if cosigners_cfg else 0
 
         for cs in cosigners_cfg:
+            addr = cs.get("p2pAddr", "")
             self.cosigners.append({
                 "shard_id": cs.get("shardID", 0),
-                "address": cs.get("p2pAddr", ""),
+                "address": addr,
+                "host": host_from_address(addr) if addr else "",
             })
 
         self.cosigners.sort(key=lambda c: c["shard_id"])
@@ -107,9 +174,10 @@ class Config:
         for node in chain_nodes:
             addr = node.get("privValAddr", "")
             if addr:
-                self.sentries.append({"address": addr})
+                # Host parsed once here; the RPC probe reuses it every cycle
+                self.sentries.append({"address": addr, "host": parse_address(addr)[0]})
 
-    @property
+    @cached_property
     def metrics_url(self) -> str:
         if not self.debug_addr:
             return ""
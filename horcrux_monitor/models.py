@@ -1,53 +1,64 @@
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 from typing import Optional
 import time
 
 
-class Severity(Enum):
-    OK = "ok"
-    WARNING = "warning"
-    CRITICAL = "critical"
+# Ordered by urgency, so statuses compare as ints and max() picks the worst
+class Severity(IntEnum):
+    OK = 0
+    WARNING = 1
+    CRITICAL = 2
 
 
-class CheckStatus(Enum):
-    OK = "ok"
-    WARNING = "warning"
-    CRITICAL = "critical"
+class CheckStatus(IntEnum):
+    OK = 0
+    WARNING = 1
+    CRITICAL = 2
 
 
-@dataclass
+_STATUS_TO_SEVERITY = {
+    CheckStatus.OK: Severity.OK,
+    CheckStatus.WARNING: Severity.WARNING,
+    CheckStatus.CRITICAL: Severity.CRITICAL,
+}
+
+
+@dataclass(slots=True, frozen=True)
 class CheckResult:
     name: str
     status: CheckStatus
-    message: str
+    template: str  # str.format template, rendered lazily via .message
     severity: Severity = Severity.OK
     alert_key: str = ""
+    args: tuple = ()
+    detail: str = ""  # report annotation after the value, e.g. " (+2 since last check)"
 
     def __post_init__(self):
+        # Frozen so identical results can be shared between reports
         if not self.alert_key:
-            self.alert_key = self.name
-        if self.status == CheckStatus.CRITICAL:
-            self.severity = Severity.CRITICAL
-        elif self.status == CheckStatus.WARNING:
-            self.severity = Severity.WARNING
-        else:
-            self.severity = Severity.OK
+            object.__setattr__(self, "alert_key", self.name)
+        object.__setattr__(self, "severity", _STATUS_TO_SEVERITY[self.status])
+
+    @property
+    def message(self) -> str:
+        return self.template.format(*self.args) if self.args else self.template
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CosignerStatus:
     shard_id: int
     address: str
     missed_shares: Optional[int]  # None for self
     is_self: bool = False
+    host: str = ""  # address without scheme and port, parsed once at config load
 
     @property
     def status(self) -> CheckStatus:
         return CheckStatus.OK
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SentryStatus:
     index: int
     address: str
@@ -60,7 +71,7 @@ class SentryStatus:
         return CheckStatus.OK if self.rpc_ok else CheckStatus.WARNING
 
 
-@dataclass
+@dataclass(slots=True)
 class FullReport:
     timestamp: float = field(default_factory=time.time)
 
@@ -101,19 +112,38 @@ class FullReport:
     # Metrics endpoint reachable
     metrics_ok: bool = True
 
+    # alert_key → first check with that key, built on first use (slots rule out cached_property)
+    _checks_by_key: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    _checks_indexed: int = field(default=0, init=False, repr=False, compare=False)
+
+    @property
+    def checks_by_key(self) -> dict:
+        """Checks indexed by alert_key for the formatter; the first check for a key wins.
+
+        Rebuilt if checks has grown since the last build.
+        """
+        if self._checks_by_key is None or self._checks_indexed != len(self.checks):
+            index = {}
+            for c in self.checks:
+                index.setdefault(c.alert_key, c)  # first check for a key wins, order kept
+            self._checks_by_key = index
+            self._checks_indexed = len(self.checks)
+        return self._checks_by_key
+
+    @property
+    def worst_status(self) -> CheckStatus:
+        return max((c.status for c in self.checks), default=CheckStatus.OK)
+
     @property
     def has_problems(self) -> bool:
-        return any(
-            c.status in (CheckStatus.WARNING, CheckStatus.CRITICAL)
-            for c in self.checks
-        )
+        return any(c.status > CheckStatus.OK for c in self.checks)
 
     @property
     def has_critical(self) -> bool:
         return any(c.status == CheckStatus.CRITICAL for c in self.checks)
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertState:
     severity: Severity
     message: str
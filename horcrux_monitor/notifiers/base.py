@@ -6,3 +6,6 @@ class BaseNotifier(abc.ABC):
     def send(self, message: str) -> bool:
         """Send a message. Returns True on success."""
         ...
+
+    def close(self):
+        """Flush pending messages and release resources."""
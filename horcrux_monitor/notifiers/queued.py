@@ -0,0 +1,44 @@
+import logging
+import queue
+import threading
+from typing import Optional
+
+from .base import BaseNotifier
+
+log = logging.getLogger(__name__)
+
+
+class QueuedNotifier(BaseNotifier):
+    """Wraps a notifier so send() only enqueues; a daemon thread delivers in order.
+
+    Keeps a slow webhook from stalling the check loop.
+    """
+
+    def __init__(self, inner: BaseNotifier):
+        self.inner = inner
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name=f"notify-{type(inner).__name__}", daemon=True,
+        )
+        self._thread.start()
+
+    def send(self, message: str) -> bool:
+        self._queue.put(message)
+        return True
+
+    def close(self, timeout: float = 30):
+        """Deliver messages already queued, then stop the worker."""
+        self._queue.put(None)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            log.warning("%s still delivering after %.0fs, giving up", type(self.inner).__name__, timeout)
+
+    def _run(self):
+        while True:
+            message = self._queue.get()
+            if message is None:
+                return
+            try:
+                self.inner.send(message)
+            except Exception:
+                log.exception("Notifier %s failed", type(self.inner).__name__)
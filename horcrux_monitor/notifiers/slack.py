@@ -10,6 +10,8 @@ class SlackNotifier(BaseNotifier):
     def __init__(self, webhook_url: str, mention: str = ""):
         self.webhook_url = webhook_url
         self.mention = mention
+        # Keep-alive: reuse the TLS connection to the webhook host between alerts
+        self._session = requests.Session()
 
     def send(self, message: str) -> bool:
         if not self.webhook_url:
@@ -21,7 +23,7 @@ class SlackNotifier(BaseNotifier):
             text = f"{self.mention}\n{text}"
 
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 self.webhook_url,
                 json={"text": text},
                 timeout=10,
@@ -12,6 +12,8 @@ class TelegramNotifier(BaseNotifier):
     def __init__(self, bot_token: str, chat_id: str):
         self.bot_token = bot_token
         self.chat_id = chat_id
+        # Keep-alive: reuse the TLS connection to the Bot API between alerts
+        self._session = requests.Session()
 
     def send(self, message: str) -> bool:
         if not self.bot_token or not self.chat_id:
@@ -19,7 +21,7 @@ class TelegramNotifier(BaseNotifier):
             return False
 
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 API_URL.format(token=self.bot_token),
                 json={
                     "chat_id": self.chat_id,
@@ -1,5 +1,7 @@
+import io
 from datetime import datetime
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Tuple
 from zoneinfo import ZoneInfo
 
 from .models import CheckResult, CheckStatus, FullReport, CosignerStatus, SentryStatus
@@ -11,6 +13,47 @@ EMOJI = {
     CheckStatus.CRITICAL: "\U0001f534",     # 🔴
 }
 
+# Indented "  <emoji> " lead-in of each status row in the full report
+_LINE_PREFIX = {status: f"  {emoji} " for status, emoji in EMOJI.items()}
+
+_ALERT_PREFIX = "\U0001f6a8 Horcrux Alert"  # 🚨
+_ALERT_PREFIX_ONGOING = "\U0001f6a8 Horcrux Alert (ongoing)"
+_RECOVERY_PREFIX = "\u2705 Horcrux Recovery"
+
+# Signing section rows as (report field, alert key, label), in display order.
+# Gauges compared against a threshold, shown as plain integers:
+_SIGNING_GAUGES = (
+    ("missed_prevotes", "missed_prevotes", "Missed prevotes (consecutive)"),
+    ("missed_precommits", "missed_precommits", "Missed precommits (consecutive)"),
+)
+# Counters alerted on growth, shown with their "(+N since last check)" / "(stable)" suffix:
+_SIGNING_COUNTERS = (
+    ("insufficient_cosigner_errors", "insufficient_cosigners", "Insufficient cosigner errors"),
+    ("invalid_signature_errors", "invalid_signatures", "Invalid signature errors"),
+    ("beyond_block_errors", "beyond_block_errors", "Beyond-block errors"),
+    ("failed_sign_votes", "failed_sign_votes", "Failed sign votes"),
+)
+
+
+@lru_cache(maxsize=8)
+def _tz(timezone: str) -> Tuple[ZoneInfo, str]:
+    """ZoneInfo and display name (e.g. 'Dubai') for a timezone key, built once per key."""
+    return ZoneInfo(timezone), timezone.split("/")[-1]
+
+
+@lru_cache(maxsize=256)
+def _fmt_int(n: int) -> str:
+    """Thousands-grouped integer; heights and counters repeat across renders."""
+    return f"{n:,}"
+
+
+@lru_cache(maxsize=4)
+def _minute_str(minute: int, timezone: str) -> str:
+    """Local "YYYY-MM-DD HH:MM" for a minute since the epoch; renders within a minute share it."""
+    now = datetime.fromtimestamp(minute * 60, tz=_tz(timezone)[0])
+    # Fixed format: build it from the fields instead of having strftime parse a pattern
+    return f"{now.year:04d}-{now.month:02d}-{now.day:02d} {now.hour:02d}:{now.minute:02d}"
+
 
 def _format_duration(seconds: float) -> str:
     if seconds < 60:
@@ -18,13 +61,11 @@ def _format_duration(seconds: float) -> str:
     elif seconds < 3600:
         return f"{seconds / 60:.0f}m"
     elif seconds < 86400:
-        hours = int(seconds // 3600)
-        mins = int((seconds % 3600) // 60)
-        return f"{hours}h{mins}m"
+        hours, rem = divmod(int(seconds), 3600)
+        return f"{hours}h{rem // 60}m"
     else:
-        days = int(seconds // 86400)
-        hours = int((seconds % 86400) // 3600)
-        return f"{days}d{hours}h"
+        days, rem = divmod(int(seconds), 86400)
+        return f"{days}d{rem // 3600}h"
 
 
 def _format_bytes(b: float) -> str:
@@ -39,143 +80,122 @@ def _format_bytes(b: float) -> str:
 def format_full_report(report: FullReport, timezone: str, name: str = "",
                        title: str = "Horcrux Status Report") -> str:
     """Format a full status report for display."""
-    tz = ZoneInfo(timezone)
-    now = datetime.fromtimestamp(report.timestamp, tz=tz)
-    time_str = now.strftime("%Y-%m-%d %H:%M")
-    tz_name = timezone.split("/")[-1]
-
-    if report.has_critical:
-        status_icon = "\U0001f534"  # 🔴
-    elif report.has_problems:
-        status_icon = "\u26a0\ufe0f"  # ⚠️
-    else:
-        status_icon = "\u2705"  # ✅
+    tz_name = _tz(timezone)[1]
+    time_str = _minute_str(int(report.timestamp // 60), timezone)
+    # One index per report instead of a scan per line
+    checks_by_key = report.checks_by_key
+
+    # One pass over the checks instead of has_critical + has_problems
+    status_icon = EMOJI[report.worst_status]
 
     header = f"{status_icon} {title}"
     if name:
         header += f" [{name}]"
     header += f" \u2014 {time_str} ({tz_name})"
-    lines = [header, ""]
+
+    # Every line is written with its newline into one growing buffer
+    buf = io.StringIO()
+    w = buf.write
+    w(header)
+    w("\n\n")
 
     # Signing section
-    lines.append("*Signing:*")
+    w("*Signing:*\n")
     if report.last_prevote_height is not None:
-        st = _check_status_for(report, "height_stale")
-        lines.append(f"  {EMOJI[st]} Last prevote height: {report.last_prevote_height:,}")
+        st = _check_status_for(checks_by_key, "height_stale")
+        w(f"{_LINE_PREFIX[st]}Last prevote height: {_fmt_int(report.last_prevote_height)}\n")
     if report.last_precommit_height is not None:
-        lines.append(f"  \u2705 Last precommit height: {report.last_precommit_height:,}")
-    if report.missed_prevotes is not None:
-        st = _check_status_for(report, "missed_prevotes")
-        lines.append(f"  {EMOJI[st]} Missed prevotes (consecutive): {report.missed_prevotes}")
-    if report.missed_precommits is not None:
-        st = _check_status_for(report, "missed_precommits")
-        lines.append(f"  {EMOJI[st]} Missed precommits (consecutive): {report.missed_precommits}")
+        w(f"  \u2705 Last precommit height: {_fmt_int(report.last_precommit_height)}\n")
+    for attr, key, label in _SIGNING_GAUGES:
+        v = getattr(report, attr)
+        if v is not None:
+            st = _check_status_for(checks_by_key, key)
+            w(f"{_LINE_PREFIX[st]}{label}: {v}\n")
     if report.seconds_since_last_precommit is not None:
-        lines.append(f"  \u2705 Last precommit: {_format_duration(report.seconds_since_last_precommit)} ago")
-    if report.insufficient_cosigner_errors is not None:
-        st = _check_status_for(report, "insufficient_cosigners")
-        label = _check_message_suffix(report, "insufficient_cosigners")
-        lines.append(f"  {EMOJI[st]} Insufficient cosigner errors: {report.insufficient_cosigner_errors:,}{label}")
-    if report.invalid_signature_errors is not None:
-        st = _check_status_for(report, "invalid_signatures")
-        label = _check_message_suffix(report, "invalid_signatures")
-        lines.append(f"  {EMOJI[st]} Invalid signature errors: {report.invalid_signature_errors:,}{label}")
-    if report.beyond_block_errors is not None:
-        st = _check_status_for(report, "beyond_block_errors")
-        label = _check_message_suffix(report, "beyond_block_errors")
-        lines.append(f"  {EMOJI[st]} Beyond-block errors: {report.beyond_block_errors:,}{label}")
-    if report.failed_sign_votes is not None:
-        st = _check_status_for(report, "failed_sign_votes")
-        label = _check_message_suffix(report, "failed_sign_votes")
-        lines.append(f"  {EMOJI[st]} Failed sign votes: {report.failed_sign_votes:,}{label}")
+        w(f"  \u2705 Last precommit: {_format_duration(report.seconds_since_last_precommit)} ago\n")
+    for attr, key, label in _SIGNING_COUNTERS:
+        v = getattr(report, attr)
+        if v is not None:
+            st = _check_status_for(checks_by_key, key)
+            suffix = _counter_suffix(checks_by_key, key)
+            w(f"{_LINE_PREFIX[st]}{label}: {_fmt_int(v)}{suffix}\n")
 
     if not report.metrics_ok:
-        lines.append(f"  \U0001f534 Metrics endpoint unreachable")
+        w("  \U0001f534 Metrics endpoint unreachable\n")
 
     # Cosigners section
     if report.cosigners:
-        lines.append("")
-        lines.append("*Cosigners:*")
+        w("\n*Cosigners:*\n")
         for cs in report.cosigners:
-            lines.append(_format_cosigner(cs))
+            w(_format_cosigner(cs))
+            w("\n")
 
     # Sentries section
     if report.sentries:
-        lines.append("")
-        lines.append("*Sentries (chain nodes):*")
+        w("\n*Sentries (chain nodes):*\n")
         for s in report.sentries:
-            lines.append(_format_sentry(s))
+            w(_format_sentry(s))
+            w("\n")
         if report.sentry_connect_tries is not None:
-            st = _check_status_for(report, "sentry_connect_tries")
-            label = _check_message_suffix(report, "sentry_connect_tries")
-            lines.append(f"  {EMOJI[st]} Sentry connect retries: {report.sentry_connect_tries:,}{label}")
+            st = _check_status_for(checks_by_key, "sentry_connect_tries")
+            label = _counter_suffix(checks_by_key, "sentry_connect_tries")
+            w(f"{_LINE_PREFIX[st]}Sentry connect retries: {_fmt_int(report.sentry_connect_tries)}{label}\n")
         # Sentry height divergence
         heights = [s.block_height for s in report.sentries if s.block_height is not None]
         if len(heights) >= 2:
             divergence = max(heights) - min(heights)
-            st = _check_status_for(report, "sentry_height_divergence")
-            lines.append(f"  {EMOJI[st]} Height divergence: {divergence} blocks")
+            st = _check_status_for(checks_by_key, "sentry_height_divergence")
+            w(f"{_LINE_PREFIX[st]}Height divergence: {divergence} blocks\n")
 
     # Raft section
-    raft_lines = []
-    if report.is_raft_leader is not None:
-        if report.is_raft_leader:
-            raft_lines.append("  \U0001f451 Role: leader")
-        else:
-            raft_lines.append("  \U0001f465 Role: follower")
-    if report.raft_election_timeouts is not None:
-        st = _check_status_for(report, "raft_election_timeouts")
-        label = _check_message_suffix(report, "raft_election_timeouts")
-        raft_lines.append(f"  {EMOJI[st]} Election timeouts: {report.raft_election_timeouts:,}{label}")
-    if report.seconds_since_last_ephemeral_share is not None:
-        raft_lines.append(f"  \u2705 Last ephemeral share: {report.seconds_since_last_ephemeral_share:.1f}s ago")
-
-    if raft_lines:
-        lines.append("")
-        lines.append("*Raft:*")
-        lines.extend(raft_lines)
+    if (report.is_raft_leader is not None or report.raft_election_timeouts is not None
+            or report.seconds_since_last_ephemeral_share is not None):
+        w("\n*Raft:*\n")
+        if report.is_raft_leader is not None:
+            if report.is_raft_leader:
+                w("  \U0001f451 Role: leader\n")
+            else:
+                w("  \U0001f465 Role: follower\n")
+        if report.raft_election_timeouts is not None:
+            st = _check_status_for(checks_by_key, "raft_election_timeouts")
+            label = _counter_suffix(checks_by_key, "raft_election_timeouts")
+            w(f"{_LINE_PREFIX[st]}Election timeouts: {_fmt_int(report.raft_election_timeouts)}{label}\n")
+        if report.seconds_since_last_ephemeral_share is not None:
+            w(f"  \u2705 Last ephemeral share: {report.seconds_since_last_ephemeral_share:.1f}s ago\n")
 
     # Process section
-    proc_lines = []
-    if report.process_open_fds is not None and report.process_max_fds is not None:
-        st = _check_status_for(report, "fd_usage")
-        pct = (report.process_open_fds / report.process_max_fds * 100) if report.process_max_fds > 0 else 0
-        proc_lines.append(f"  {EMOJI[st]} FDs: {report.process_open_fds}/{report.process_max_fds} ({pct:.0f}%)")
-    if report.process_memory_bytes is not None:
-        st = _check_status_for(report, "memory_usage")
-        proc_lines.append(f"  {EMOJI[st]} Memory: {_format_bytes(report.process_memory_bytes)}")
-    if report.go_goroutines is not None:
-        st = _check_status_for(report, "goroutine_growth")
-        proc_lines.append(f"  {EMOJI[st]} Goroutines: {report.go_goroutines}")
-
-    if proc_lines:
-        lines.append("")
-        lines.append("*Process:*")
-        lines.extend(proc_lines)
-
-    return "\n".join(lines)
+    has_fds = report.process_open_fds is not None and report.process_max_fds is not None
+    if has_fds or report.process_memory_bytes is not None or report.go_goroutines is not None:
+        w("\n*Process:*\n")
+        if has_fds:
+            st = _check_status_for(checks_by_key, "fd_usage")
+            pct = (report.process_open_fds / report.process_max_fds * 100) if report.process_max_fds > 0 else 0
+            w(f"{_LINE_PREFIX[st]}FDs: {report.process_open_fds}/{report.process_max_fds} ({pct:.0f}%)\n")
+        if report.process_memory_bytes is not None:
+            st = _check_status_for(checks_by_key, "memory_usage")
+            w(f"{_LINE_PREFIX[st]}Memory: {_format_bytes(report.process_memory_bytes)}\n")
+        if report.go_goroutines is not None:
+            st = _check_status_for(checks_by_key, "goroutine_growth")
+            w(f"{_LINE_PREFIX[st]}Goroutines: {report.go_goroutines}\n")
+
+    # Drop the final newline; the message itself doesn't end with one
+    return buf.getvalue()[:-1]
 
 
 def format_problem_alert(checks: List[CheckResult], name: str = "",
                          is_re_alert: bool = False) -> str:
     """Format a problem alert with only the failing checks."""
-    prefix = "\U0001f6a8 Horcrux Alert" if not is_re_alert else "\U0001f6a8 Horcrux Alert (ongoing)"
-    if name:
-        prefix += f" [{name}]"
-    lines = [prefix, ""]
+    base = _ALERT_PREFIX_ONGOING if is_re_alert else _ALERT_PREFIX
+    lines = [f"{base} [{name}]" if name else base, ""]
     for check in checks:
-        emoji = EMOJI.get(check.status, "\u2753")
-        lines.append(f"{emoji} {check.message}")
+        lines.append(f"{EMOJI[check.status]} {check.message}")
     return "\n".join(lines)
 
 
 def format_recovery(recoveries: List[Tuple[str, str, float]], format_duration,
                     name: str = "") -> str:
     """Format a recovery notification."""
-    header = "\u2705 Horcrux Recovery"
-    if name:
-        header += f" [{name}]"
-    lines = [header, ""]
+    lines = [f"{_RECOVERY_PREFIX} [{name}]" if name else _RECOVERY_PREFIX, ""]
     for key, message, duration in recoveries:
         dur_str = format_duration(duration)
         lines.append(f"\u2705 Recovered: {message} (was down for {dur_str})")
@@ -187,44 +207,28 @@ def format_startup_report(report: FullReport, timezone: str, name: str = "") ->
     return format_full_report(report, timezone, name=name, title="Horcrux Monitor Started")
 
 
-def _check_status_for(report: FullReport, alert_key: str) -> CheckStatus:
+def _check_status_for(checks_by_key: Dict[str, CheckResult], alert_key: str) -> CheckStatus:
     """Find the status of a specific check in the report."""
-    for check in report.checks:
-        if check.alert_key == alert_key:
-            return check.status
-    return CheckStatus.OK
-
-
-def _check_message_suffix(report: FullReport, alert_key: str) -> str:
-    """Extract parenthetical suffix from check message (e.g., ' (stable)')."""
-    for check in report.checks:
-        if check.alert_key == alert_key:
-            msg = check.message
-            paren_idx = msg.rfind("(")
-            if paren_idx >= 0:
-                return " " + msg[paren_idx:]
-    return ""
+    check = checks_by_key.get(alert_key)
+    return check.status if check is not None else CheckStatus.OK
 
 
-def _host_from_address(addr: str) -> str:
-    """Extract host from address like 'tcp://192.168.100.2:2222' -> '192.168.100.2'."""
-    if "://" in addr:
-        addr = addr.split("://", 1)[1]
-    return addr.rsplit(":", 1)[0] if ":" in addr else addr
+def _counter_suffix(checks_by_key: Dict[str, CheckResult], alert_key: str) -> str:
+    """Annotation for a counter row: the check's detail, or ' (stable)' when it has no check."""
+    check = checks_by_key.get(alert_key)
+    return check.detail if check is not None else " (stable)"
 
 
 def _format_cosigner(cs: CosignerStatus) -> str:
-    host = _host_from_address(cs.address) if cs.address else "self"
+    host = cs.host or "(self)"
     if cs.is_self:
         return f"  \u2705 Shard {cs.shard_id} ({host}) \u2014 self"
     elif cs.missed_shares is not None:
-        emoji = EMOJI[cs.status]
-        return f"  {emoji} Shard {cs.shard_id} ({host}) \u2014 missed shares: {cs.missed_shares}"
+        return f"{_LINE_PREFIX[cs.status]}Shard {cs.shard_id} ({host}) \u2014 missed shares: {cs.missed_shares}"
     else:
         return f"  \u2705 Shard {cs.shard_id} ({host}) \u2014 missed shares: n/a"
 
 
 def _format_sentry(s: SentryStatus) -> str:
-    emoji = EMOJI[s.status]
-    height_str = f"{s.block_height:,}" if s.block_height is not None else "unreachable"
-    return f"  {emoji} Sentry {s.index} ({s.host}) \u2014 height: {height_str}"
+    height_str = _fmt_int(s.block_height) if s.block_height is not None else "unreachable"
+    return f"{_LINE_PREFIX[s.status]}Sentry {s.index} ({s.host}) \u2014 height: {height_str}"
@@ -17,6 +17,8 @@ class StateManager:
         self.tz = ZoneInfo(timezone)
         self.active_alerts: Dict[str, AlertState] = {}
         self.last_scheduled_hour: Optional[int] = None
+        # Unix time of the next local hour boundary; the due check can't change before it
+        self._recheck_at: float = 0.0
 
     def process_report(self, report: FullReport) -> dict:
         """Process a report and determine what notifications to send.
@@ -25,40 +27,51 @@ class StateManager:
         CRITICAL: immediate alert + re-alert on cooldown + recovery.
         """
         now = time.time()
+        active = self.active_alerts
         new_alerts = []
         re_alerts = []
-        recoveries = []
+        # Bound once — the classify loop below appends per critical check
+        add_new = new_alerts.append
+        add_re = re_alerts.append
 
-        # Only track CRITICAL alerts
-        current_critical = {}
-        for check in report.checks:
-            if check.status == CheckStatus.CRITICAL:
-                current_critical[check.alert_key] = check
+        # Only track CRITICAL alerts; read checks directly, not the first-wins render index
+        critical = CheckStatus.CRITICAL
+        current_critical = {c.alert_key: c for c in report.checks if c.status == critical}
 
         for key, check in current_critical.items():
-            if key not in self.active_alerts:
-                self.active_alerts[key] = AlertState(
+            alert = active.get(key)
+            if alert is None:
+                active[key] = AlertState(
                     severity=check.severity,
                     message=check.message,
                     first_seen=now,
                     last_alerted=now,
                     count=1,
                 )
-                new_alerts.append(check)
+                add_new(check)
             else:
-                alert = self.active_alerts[key]
                 alert.message = check.message
                 alert.count += 1
                 if now - alert.last_alerted >= self.alert_cooldown:
                     alert.last_alerted = now
-                    re_alerts.append(check)
+                    add_re(check)
 
         # Recoveries (CRITICAL only)
-        resolved_keys = [k for k in self.active_alerts if k not in current_critical]
-        for key in resolved_keys:
-            alert = self.active_alerts.pop(key)
-            duration = now - alert.first_seen
-            recoveries.append((key, alert.message, duration))
+        # Dict views support set ops; usually empty, so most ticks stop here
+        resolved_keys = active.keys() - current_critical.keys()
+        recoveries = []
+        if resolved_keys:
+            # Walk active_alerts so recoveries come out in first-seen order
+            recoveries = [
+                (key, alert.message, now - alert.first_seen)
+                for key, alert in active.items() if key in resolved_keys
+            ]
+            # A few resolutions: pop them; many (e.g. metrics came back): one rebuild beats N pops
+            if len(resolved_keys) > len(active) // 4:
+                self.active_alerts = {k: v for k, v in active.items() if k in current_critical}
+            else:
+                for key in resolved_keys:
+                    del active[key]
 
         return {
             "new_alerts": new_alerts,
@@ -68,7 +81,11 @@ class StateManager:
 
     def is_scheduled_report_due(self) -> bool:
         """Check if a scheduled report should be sent now."""
-        now = datetime.now(self.tz)
+        ts = time.time()
+        if ts < self._recheck_at:
+            return False
+        now = datetime.fromtimestamp(ts, self.tz)
+        self._recheck_at = ts - (now.minute * 60 + now.second + now.microsecond / 1e6) + 3600
         current_hour = now.hour
 
         if current_hour in self.scheduled_hours:
@@ -83,6 +100,5 @@ class StateManager:
         elif seconds < 3600:
             return f"{seconds / 60:.0f}m"
         else:
-            hours = int(seconds // 3600)
-            mins = int((seconds % 3600) // 60)
-            return f"{hours}h{mins}m"
+            hours, rem = divmod(int(seconds), 3600)
+            return f"{hours}h{rem // 60}m"
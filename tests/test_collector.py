@@ -0,0 +1,52 @@
+import unittest
+
+from horcrux_monitor.collector import parse_prometheus_bytes, parse_prometheus_text
+
+
+class ParsePrometheusTest(unittest.TestCase):
+    def test_comments_and_blank_lines_skipped(self):
+        m = parse_prometheus_text(
+            "# HELP a Something\n"
+            "# TYPE a gauge\n"
+            "\n"
+            "a 1\n"
+        )
+        self.assertEqual(m.scalar, {"a": 1.0})
+        self.assertEqual(m.labeled, {})
+
+    def test_trailing_whitespace_kept(self):
+        m = parse_prometheus_text('a 1 \nb 2\t\nd{x="2"} 5 \n')
+        self.assertEqual(m.scalar, {"a": 1.0, "b": 2.0})
+        self.assertEqual(m.labeled, {"d": {'x="2"': 5.0}})
+
+    def test_crlf_line_endings(self):
+        m = parse_prometheus_bytes(b'# TYPE a gauge\r\na 1\r\nd{x="2"} 5\r\n\r\n')
+        self.assertEqual(m.scalar, {"a": 1.0})
+        self.assertEqual(m.labeled, {"d": {'x="2"': 5.0}})
+
+    def test_repeated_blanks_before_value(self):
+        m = parse_prometheus_text('a  1\nd{x="2"}  5\n')
+        self.assertEqual(m.scalar, {"a": 1.0})
+        self.assertEqual(m.labeled, {"d": {'x="2"': 5.0}})
+
+    def test_last_line_without_newline(self):
+        m = parse_prometheus_text("a 1\nb 2 ")
+        self.assertEqual(m.scalar, {"a": 1.0, "b": 2.0})
+
+    def test_names_filter(self):
+        m = parse_prometheus_text('a 1\nb 2\nd{x="2"} 5\ne{x="3"} 6\n', {"a", "d"})
+        self.assertEqual(m.scalar, {"a": 1.0})
+        self.assertEqual(m.labeled, {"d": {'x="2"': 5.0}})
+
+    def test_label_value_with_space(self):
+        m = parse_prometheus_text('d{x="a b"} 5\n')
+        self.assertEqual(m.labeled, {"d": {'x="a b"': 5.0}})
+
+    def test_malformed_lines_skipped(self):
+        m = parse_prometheus_text("a\nb abc\nc{ 3\nd 4\n")
+        self.assertEqual(m.scalar, {"d": 4.0})
+        self.assertEqual(m.labeled, {})
+
+
+if __name__ == "__main__":
+    unittest.main()